@@ -138,6 +138,10 @@ def check_verify_status_by_course(user, course_enrollments):
     expiration_datetime = IDVerificationService.get_expiration_datetime(user, ['approved'])
     verification_expiring_soon = is_verification_expiring_soon(expiration_datetime)
 
+    # Equivalent to IDVerificationService.user_is_verified(), but reuses the expiration
+    # datetime above instead of querying the verifications again for every enrollment
+    user_is_verified = expiration_datetime is not None and expiration_datetime >= datetime.now(UTC)
+
     # Retrieve verification deadlines for the enrolled courses
     course_deadlines = VerificationDeadline.deadlines_for_enrollments(
         CourseEnrollment.enrollments_for_user(user)
@@ -194,12 +198,12 @@ def check_verify_status_by_course(user, course_enrollments):
             )
             if status is None and not submitted:
                 if deadline is None or deadline > datetime.now(UTC):
-                    if IDVerificationService.user_is_verified(user) and verification_expiring_soon:
+                    if user_is_verified and verification_expiring_soon:
                         # The user has an active verification, but the verification
                         # is set to expire within "EXPIRING_SOON_WINDOW" days (default is 4 weeks).
                         # Tell the student to reverify.
                         status = VERIFY_STATUS_NEED_TO_REVERIFY
-                    elif not IDVerificationService.user_is_verified(user):
+                    elif not user_is_verified:
                         status = VERIFY_STATUS_NEED_TO_VERIFY
                 else:
                     # If a user currently has an active or pending verification,